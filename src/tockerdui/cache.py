@@ -101,6 +101,10 @@ class CacheManager:
             self._cache[key] = CacheEntry(value, time.time(), ttl)
             self._stats['sets'] += 1
     
+    def is_empty(self) -> bool:
+        """Return True if no entries are cached (a lock-free snapshot)."""
+        return not self._cache
+
     def invalidate(self, pattern: Optional[str] = None) -> None:
         """Invalidate cache entries matching pattern."""
         with self._lock:
@@ -89,6 +89,19 @@ class AppConfig:
     docker: DockerConfig = field(default_factory=DockerConfig)
     logging: LogConfig = field(default_factory=LogConfig)
 
+
+# Symbolic names accepted in config for non-printable keys.
+_KEY_ALIASES = {
+    "space": " ",
+    "tab": "\t",
+    "enter": "\n",
+}
+
+
+def _normalize_binding(binding: str) -> str:
+    return _KEY_ALIASES.get(str(binding).lower(), binding)
+
+
 class ConfigManager:
     """Configuration manager with YAML file support."""
     
@@ -214,16 +227,27 @@ class ConfigManager:
         if not binding:
             return False
 
-        # Support symbolic names in config for non-printable keys.
-        aliases = {
-            "space": " ",
-            "tab": "\t",
-            "enter": "\n",
-        }
-        normalized = aliases.get(str(binding).lower(), binding)
+        normalized = _normalize_binding(binding)
         if normalized == "\n" and key == "\r":
             return True
         return key == normalized
+
+    def get_key_action_map(self, actions: List[str]) -> Dict[str, str]:
+        """Build a key -> action lookup for the given actions.
+
+        Matches is_key_binding() semantics, so callers can resolve a key press
+        with one dict lookup. When actions share a key, the first one wins.
+        """
+        key_map: Dict[str, str] = {}
+        for action in actions:
+            binding = self.get_key_binding(action)
+            if not binding:
+                continue
+            normalized = _normalize_binding(binding)
+            key_map.setdefault(normalized, action)
+            if normalized == "\n":
+                key_map.setdefault("\r", action)
+        return key_map
     
     def get_log_level(self) -> str:
         """Get configured log level."""
@@ -98,6 +98,31 @@ class AppState:
     logs_scroll_offset: int = 0
     self_usage: str = ""
     last_error: str = ""  # Error message to display
-    error_timestamp: float = 0.0  # Time when error was set (for auto-clear after 3s)
+    error_timestamp: float = 0.0  # time.monotonic() when error was set (for auto-clear after 3s)
     bulk_select_mode: bool = False  # Enable bulk selection
     stats_data: dict = field(default_factory=dict)  # Statistics dashboard data
+
+
+def _match_container(needle: str, item: Any) -> bool:
+    return needle in item.name.lower() or needle in item.image.lower()
+
+
+def _match_image(needle: str, item: Any) -> bool:
+    return needle in item.short_id.lower() or any(
+        needle in tag.lower() for tag in item.tags
+    )
+
+
+def _match_name(needle: str, item: Any) -> bool:
+    return needle in item.name.lower()
+
+
+# Filter predicate per tab, taking the lower-cased filter text and an item.
+# Shared by the Textual app and StateManager so both filter alike.
+FILTER_MATCHERS = {
+    "containers": _match_container,
+    "images": _match_image,
+    "volumes": _match_name,
+    "networks": _match_name,
+    "compose": _match_name,
+}
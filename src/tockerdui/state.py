@@ -10,7 +10,6 @@ Architecture:
   - Worker threads: Daemon threads that update state in background
     - ListWorker: Updates containers/images/volumes/networks (1s interval)
     - StatsWorker: Updates CPU/RAM statistics (2s interval)
-    - LogsWorker: Streams logs for selected container (0.5s interval)
 
 Thread Safety:
   - All state access protected by self._lock (RLock for reentrant locking)
@@ -30,15 +29,14 @@ State Update Pattern:
   4. Main thread detects change and re-renders
 
 Optimization:
-  - Different update intervals (containers 1s, stats 2s, logs 0.5s)
+  - Different update intervals (containers 1s, stats 2s)
   - Coarse-grained locking (entire state) vs fine-grained (per-collection)
 """
 
 import threading
 import time
-import select
 from typing import List, Optional
-from .model import AppState, ContainerInfo
+from .model import FILTER_MATCHERS, AppState, ContainerInfo
 from .backend import DockerBackend
 from .config import config_manager
 
@@ -49,10 +47,24 @@ class StateManager:
         self._state = AppState()
         self._lock = threading.RLock()  # Use RLock for reentrant locking
         self._version = 0
+        # Last snapshot handed out and the version it was built at; reused
+        # until a mutator bumps the version.
+        self._snapshot: Optional[AppState] = None
+        self._snapshot_version = -1
     
     def get_version(self):
         with self._lock: return self._version
 
+    def get_selected_index(self) -> int:
+        """Current list selection, without building a snapshot."""
+        with self._lock: return self._state.selected_index
+
+    def reset(self) -> None:
+        """Discard all state and start over from a fresh AppState."""
+        with self._lock:
+            self._state = AppState()
+            self._inc_version()
+
     def _inc_version(self):
         # Assumes lock is held
         self._version += 1
@@ -136,10 +148,9 @@ class StateManager:
     
     def set_error(self, error_msg: str) -> None:
         """Set error message that will auto-clear after 3 seconds."""
-        import time
         with self._lock:
             self._state.last_error = error_msg
-            self._state.error_timestamp = time.time()
+            self._state.error_timestamp = time.monotonic()
             self._inc_version()
     
     def clear_error(self) -> None:
@@ -299,23 +310,9 @@ class StateManager:
         if not self._state.filter_text:
             return items
             
-        ft = self._state.filter_text.lower()
-        res = []
-        for i in items:
-            match = False
-            if tab == "containers":
-                if ft in i.name.lower() or ft in i.image.lower(): match = True
-            elif tab == "images":
-                if ft in i.short_id.lower() or any(ft in t.lower() for t in i.tags): match = True
-            elif tab == "volumes":
-                if ft in i.name.lower(): match = True
-            elif tab == "networks":
-                if ft in i.name.lower(): match = True
-            elif tab == "compose":
-                if ft in i.name.lower(): match = True
-            
-            if match: res.append(i)
-        return res
+        needle = self._state.filter_text.lower()
+        matches = FILTER_MATCHERS[tab]
+        return [i for i in items if matches(needle, i)]
 
     def move_selection(self, delta, page_height=None):
         with self._lock:
@@ -344,53 +341,66 @@ class StateManager:
                         elif self._state.selected_index >= self._state.scroll_offset + page_height:
                             self._state.scroll_offset = self._state.selected_index - page_height + 1
                     self._inc_version() # Also if scroll changed
-            else:
-                 self._state.selected_index = 0
+            elif self._state.selected_index != 0:
+                self._state.selected_index = 0
+                self._inc_version()
 
     def get_snapshot(self) -> AppState:
+        """Return a copy of the filtered state; treat it as read-only.
+
+        Consecutive calls with no mutation in between return the same object.
+        """
         with self._lock:
-            f_containers = self._get_filtered_list_unlocked("containers")
-            f_images = self._get_filtered_list_unlocked("images")
-            f_volumes = self._get_filtered_list_unlocked("volumes")
-            f_networks = self._get_filtered_list_unlocked("networks")
-            f_composes = self._get_filtered_list_unlocked("compose")
-            
-            return AppState(
-                containers=[
-                    ContainerInfo(
-                        c.id,
-                        c.short_id,
-                        c.name,
-                        c.status,
-                        c.image,
-                        c.project,
-                        c.cpu_percent,
-                        c.ram_usage,
-                        getattr(c, "selected", False),
-                    )
-                    for c in f_containers
-                ],
-                images=list(f_images),
-                volumes=list(f_volumes),
-                networks=list(f_networks),
-                composes=list(f_composes),
-                selected_tab=self._state.selected_tab,
-                selected_index=self._state.selected_index,
-                scroll_offset=self._state.scroll_offset,
-                logs=list(self._state.logs),
-                message=self._state.message,
-                filter_text=self._state.filter_text,
-                is_filtering=self._state.is_filtering,
-                sort_mode=self._state.sort_mode,
-                update_available=self._state.update_available,
-                focused_pane=self._state.focused_pane,
-                logs_scroll_offset=self._state.logs_scroll_offset,
-                self_usage=self._state.self_usage,
-                last_error=self._state.last_error,
-                error_timestamp=self._state.error_timestamp,
-                bulk_select_mode=self._state.bulk_select_mode,
-                stats_data=dict(self._state.stats_data),
-            )
+            snapshot = self._snapshot
+            if snapshot is None or self._snapshot_version != self._version:
+                snapshot = self._build_snapshot_unlocked()
+                self._snapshot = snapshot
+                self._snapshot_version = self._version
+            return snapshot
+
+    def _build_snapshot_unlocked(self) -> AppState:
+        f_containers = self._get_filtered_list_unlocked("containers")
+        f_images = self._get_filtered_list_unlocked("images")
+        f_volumes = self._get_filtered_list_unlocked("volumes")
+        f_networks = self._get_filtered_list_unlocked("networks")
+        f_composes = self._get_filtered_list_unlocked("compose")
+
+        return AppState(
+            containers=[
+                ContainerInfo(
+                    c.id,
+                    c.short_id,
+                    c.name,
+                    c.status,
+                    c.image,
+                    c.project,
+                    c.cpu_percent,
+                    c.ram_usage,
+                    getattr(c, "selected", False),
+                )
+                for c in f_containers
+            ],
+            images=list(f_images),
+            volumes=list(f_volumes),
+            networks=list(f_networks),
+            composes=list(f_composes),
+            selected_tab=self._state.selected_tab,
+            selected_index=self._state.selected_index,
+            scroll_offset=self._state.scroll_offset,
+            logs=list(self._state.logs),
+            message=self._state.message,
+            filter_text=self._state.filter_text,
+            is_filtering=self._state.is_filtering,
+            sort_mode=self._state.sort_mode,
+            update_available=self._state.update_available,
+            focused_pane=self._state.focused_pane,
+            logs_scroll_offset=self._state.logs_scroll_offset,
+            self_usage=self._state.self_usage,
+            last_error=self._state.last_error,
+            error_timestamp=self._state.error_timestamp,
+            bulk_select_mode=self._state.bulk_select_mode,
+            stats_data=dict(self._state.stats_data),
+        )
 
     def get_all_containers(self) -> List[ContainerInfo]:
         """Return a copy of all containers without filter/sort applied."""
@@ -421,151 +431,74 @@ class StateManager:
         return None
 
 class ListWorker(threading.Thread):
+    container_interval = 1.0
+    others_interval = 5.0
+    cleanup_interval = 30.0
+
     def __init__(self, state_manager: StateManager, backend: DockerBackend):
         super().__init__(daemon=True)
         self.state_manager = state_manager
         self.backend = backend
         self.running = True
         self._force_refresh_flag = False
+        self._last_containers = 0.0
+        self._last_others = 0.0
+        self._last_cleanup = 0.0
     
     def force_refresh(self) -> None:
         self._force_refresh_flag = True
 
+    def check_updates(self) -> None:
+        """Flag an available update, if update checks are enabled in config."""
+        if config_manager.should_auto_update() and self.backend.check_for_updates():
+            self.state_manager.set_update_available(True)
+
+    def run_once(self) -> None:
+        """Refresh whichever resources are due; one iteration of run()."""
+        # Force refresh logic
+        if self._force_refresh_flag:
+            self._last_containers = 0.0
+            self._last_others = 0.0
+            self._last_cleanup = 0.0
+            self._force_refresh_flag = False
+
+        now = time.monotonic()
+
+        # Containers: refresh frequently
+        if now - self._last_containers >= self.container_interval:
+            containers = self.backend.get_containers()
+            self.state_manager.update_containers(containers)
+            self._last_containers = now
+
+        # Other resources: refresh less frequently
+        if now - self._last_others >= self.others_interval:
+            self.state_manager.update_images(self.backend.get_images())
+            self.state_manager.update_volumes(self.backend.get_volumes())
+            self.state_manager.update_networks(self.backend.get_networks())
+            self.state_manager.update_composes(self.backend.get_composes())
+            self._last_others = now
+
+        # Periodic cache cleanup
+        if now - self._last_cleanup >= self.cleanup_interval:
+            from .cache import cache_manager
+            cache_manager.cleanup_expired()
+            self._last_cleanup = now
+
     def run(self) -> None:
         import logging
         logger = logging.getLogger(__name__)
-        last_containers = 0.0
-        last_others = 0.0
-        last_cleanup = 0.0
-        container_interval = 1.0
-        others_interval = 5.0
-        cleanup_interval = 30.0
         # Check updates once at startup if enabled in config
-        if config_manager.should_auto_update() and self.backend.check_for_updates():
-            self.state_manager.set_update_available(True)
+        self.check_updates()
 
         while self.running:
             try:
-                # Force refresh logic
-                if self._force_refresh_flag:
-                    last_containers = 0.0
-                    last_others = 0.0
-                    last_cleanup = 0.0
-                    self._force_refresh_flag = False
-
-                now = time.monotonic()
-
-                # Containers: refresh frequently
-                if now - last_containers >= container_interval:
-                    containers = self.backend.get_containers()
-                    self.state_manager.update_containers(containers)
-                    last_containers = now
-                
-                # Other resources: refresh less frequently
-                if now - last_others >= others_interval:
-                    self.state_manager.update_images(self.backend.get_images())
-                    self.state_manager.update_volumes(self.backend.get_volumes())
-                    self.state_manager.update_networks(self.backend.get_networks())
-                    self.state_manager.update_composes(self.backend.get_composes())
-                    last_others = now
-                
-                # Periodic cache cleanup
-                if now - last_cleanup >= cleanup_interval:
-                    from .cache import cache_manager
-                    cache_manager.cleanup_expired()
-                    last_cleanup = now
-                    
+                self.run_once()
             except Exception as e:
                 logger.error(f"ListWorker error: {e}", exc_info=True)
                 time.sleep(2.0)
 
             time.sleep(0.2)
 
-class LogsWorker(threading.Thread):
-    def __init__(self, state_manager: StateManager, backend: DockerBackend):
-        super().__init__(daemon=True)
-        self.state_manager = state_manager
-        self.backend = backend
-        self.running = True
-        self.current_container_id = None
-        self.process = None
-        self.log_buffer = []
-        self.max_buffer_size = 1000
-
-    def run(self) -> None:
-        while self.running:
-            try:
-                # 1. Determine target container
-                snapshot = self.state_manager.get_snapshot()
-                target_id = None
-                
-                if snapshot.selected_tab == "containers":
-                    target_id = self.state_manager.get_selected_item_id()
-                
-                # 2. Handle container switch
-                if target_id != self.current_container_id:
-                    # Kill old process
-                    if self.process:
-                        self.process.terminate()
-                        try:
-                            self.process.wait(timeout=0.2)
-                        except:
-                            self.process.kill()
-                        self.process = None
-                    
-                    self.current_container_id = target_id
-                    self.log_buffer = []
-                    self.state_manager.set_logs(["Loading logs..."])
-                    
-                    if target_id:
-                        try:
-                            self.process = self.backend.get_log_stream_process(target_id, tail=50)
-                        except Exception as e:
-                            self.state_manager.set_logs([f"Error starting logs: {e}"])
-                
-                # 3. Read stream if process active
-                if self.process:
-                    # Check if process is still alive
-                    if self.process.poll() is not None:
-                        # Process died
-                        self.process = None
-                        continue
-                        
-                    # Non-blocking read using select
-                    # Wait up to 0.1s for data
-                    try:
-                        reads = [self.process.stdout.fileno()]
-                        ret = select.select(reads, [], [], 0.1)
-                        
-                        if ret[0]:
-                            # Data available
-                            line = self.process.stdout.readline()
-                            if line:
-                                self.log_buffer.append(line.rstrip())
-                                if len(self.log_buffer) > self.max_buffer_size:
-                                    self.log_buffer = self.log_buffer[-self.max_buffer_size:]
-                                
-                                # Update state
-                                self.state_manager.set_logs(list(self.log_buffer))
-                                
-                                # Auto scroll if near bottom (simplified: always nudge if follow mode implied)
-                                self.state_manager.scroll_logs(1, 1000)
-                    except ValueError:
-                        # File descriptor closed
-                        self.process = None
-                else:
-                    time.sleep(0.5)  # Sleep longer when idle
-                    
-            except Exception as e:
-                time.sleep(1.0)
-        
-        # Cleanup on exit
-        if self.process:
-            try:
-                self.process.terminate()
-            except:
-                pass
-
 class StatsWorker(threading.Thread):
     def __init__(self, state_manager: StateManager, backend: DockerBackend):
         super().__init__(daemon=True)
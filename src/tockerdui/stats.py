@@ -318,13 +318,11 @@ class ChartRenderer:
             return "▄" * min(width, len(values))
         
         spark_chars = "▁▂▃▄▅▆▇█"
-        result = []
+        top = len(spark_chars) - 1
         
-        for i, value in enumerate(values[:width]):
-            if i >= width:
-                break
-            normalized = (value - min_val) / range_val
-            char_index = int(normalized * (len(spark_chars) - 1))
-            result.append(spark_chars[char_index])
-        
-        return ''.join(result)
\ No newline at end of file
+        # Single comprehension over the visible window: no per-sample
+        # bounds check, append or len() call.
+        return ''.join([
+            spark_chars[int((value - min_val) / range_val * top)]
+            for value in values[:width]
+        ])
\ No newline at end of file
@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import asyncio
+import codecs
 import os
+import select
 import shutil
 import subprocess
+import threading
 import time
-from typing import Any, Optional
+from collections import deque
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Optional, Sequence
 
 from textual import events
 from textual.app import App, ComposeResult
@@ -15,14 +21,354 @@ from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
 from textual.screen import ModalScreen
 from textual.widgets import Footer, Header, Input, Static, Tab, Tabs
-from rich.markup import escape as rich_escape
 
 from .backend import DockerBackend
 from .cache import cache_manager
 from .config import config_manager
+from .model import FILTER_MATCHERS
 from .stats import StatsCollector
 
 
+# List header per tab, aligned with the row templates below.
+_HEADERS = {
+    "containers": "PROJECT      NAME                 STATUS     CPU     MEM        IMAGE",
+    "images": "SHORT ID        SIZE      CREATED    TAGS",
+    "volumes": "NAME                 DRIVER     MOUNTPOINT",
+    "networks": "NAME                 DRIVER     SUBNET",
+    "compose": "NAME                 STATUS     CONFIG FILES",
+}
+
+# Row layout per tab: a %-template for the fixed-width columns, their total
+# width, and the minimum width of the trailing column, which takes whatever
+# space the list pane has left. "%-N.Ns" pads and truncates in one step
+# without allocating an intermediate slice.
+_ROW_LAYOUTS = {
+    "containers": ("%-12.12s %-20.20s %-10.10s %-7s %-10s ", 64, 28),
+    "images": ("%-15.15s %8.1fMB %-10.10s ", 38, 45),
+    "volumes": ("%-20.20s %-10.10s ", 32, 45),
+    "networks": ("%-20.20s %-10.10s ", 32, 40),
+    "compose": ("%-20.20s %-10.10s ", 32, 45),
+}
+
+# Width of the widest row prefix ("> [x] ").
+_ROW_PREFIX_WIDTH = 6
+
+
+@lru_cache(maxsize=64)
+def _layout_for_tab(tab: str, width: int) -> str:
+    """Return the row template for ``tab`` when the list pane is ``width`` wide."""
+    fixed, fixed_width, min_tail = _ROW_LAYOUTS[tab]
+    tail = max(min_tail, width - _ROW_PREFIX_WIDTH - fixed_width)
+    return f"{fixed}%.{tail}s"
+
+
+# The fields each row displays, per tab. The resulting tuple doubles as the
+# row's signature: unchanged rows reuse their formatted text between renders.
+_ROW_FIELDS: dict[str, Callable[[Any], tuple]] = {
+    "containers": attrgetter(
+        "project", "name", "status", "cpu_percent", "ram_usage", "image"
+    ),
+    "images": lambda item: (item.short_id, item.size_mb, item.created, str(item.tags)),
+    "volumes": attrgetter("name", "driver", "mountpoint"),
+    "networks": attrgetter("name", "driver", "subnet"),
+    "compose": attrgetter("name", "status", "config_files"),
+}
+
+
+def _cpu_sort_key(item: Any) -> float:
+    cpu = str(item.cpu_percent).strip("%")
+    # Containers without stats show "--"; answer those without raising.
+    if cpu == "--" or not cpu:
+        return -1.0
+    try:
+        return float(cpu)
+    except ValueError:
+        return -1.0
+
+
+# Identity used for bulk selection, per tab.
+_ID_GETTERS = {
+    "containers": attrgetter("id"),
+    "images": attrgetter("id"),
+    "networks": attrgetter("id"),
+    "volumes": attrgetter("name"),
+    "compose": attrgetter("name"),
+}
+
+# Configurable keybinding actions handled directly in on_key.
+_CONFIG_KEY_HANDLERS = {
+    "select_toggle": "action_toggle_select",
+    "select_all": "action_select_all",
+    "select_none": "action_select_none",
+}
+
+
+def _container_info(item: Any) -> str:
+    return (
+        f"ID: {item.id}\n"
+        f"Name: {item.name}\n"
+        f"Status: {item.status}\n"
+        f"Image: {item.image}"
+    )
+
+
+def _image_info(item: Any) -> str:
+    return (
+        f"ID: {item.id}\n"
+        f"Tags: {item.tags}\n"
+        f"Size: {item.size_mb:.1f}MB\n"
+        f"Created: {item.created}"
+    )
+
+
+def _volume_info(item: Any) -> str:
+    return (
+        f"Name: {item.name}\n"
+        f"Driver: {item.driver}\n"
+        f"Mountpoint: {item.mountpoint}"
+    )
+
+
+def _network_info(item: Any) -> str:
+    return (
+        f"ID: {item.id}\n"
+        f"Name: {item.name}\n"
+        f"Driver: {item.driver}\n"
+        f"Subnet: {item.subnet}"
+    )
+
+
+def _compose_info(item: Any) -> str:
+    return (
+        f"Project: {item.name}\n"
+        f"Status: {item.status}\n"
+        f"Config: {item.config_files}"
+    )
+
+
+# Details pane renderer per tab.
+_INFO_RENDERERS = {
+    "containers": _container_info,
+    "images": _image_info,
+    "volumes": _volume_info,
+    "networks": _network_info,
+    "compose": _compose_info,
+}
+
+
+# Action menu entries per tab as (label, action key), for single items and
+# for bulk selections. Built once at import rather than on every menu open.
+_MENU_OPTIONS = {
+    "containers": (
+        ("Start", "s"),
+        ("Stop", "t"),
+        ("Restart", "r"),
+        ("Pause/Unpause", "z"),
+        ("Rename", "n"),
+        ("Commit", "k"),
+        ("Copy To", "cp"),
+        ("Exec Shell", "x"),
+        ("Logs", "l"),
+        ("Inspect", "i"),
+        ("Delete", "d"),
+    ),
+    "images": (
+        ("Run", "R"),
+        ("Pull/Update", "p"),
+        ("Save (tar)", "S"),
+        ("Load (tar)", "L"),
+        ("History", "H"),
+        ("Build", "B"),
+        ("Inspect", "i"),
+        ("Delete", "d"),
+    ),
+    "volumes": (("Create", "C"), ("Inspect", "i"), ("Delete", "d")),
+    "networks": (("Inspect", "i"), ("Delete", "d")),
+    "compose": (
+        ("Up", "U"),
+        ("Down", "D"),
+        ("Restart", "X"),
+        ("Pull", "p"),
+        ("Logs", "l"),
+        ("Remove", "r"),
+        ("Pause", "P"),
+    ),
+}
+_BULK_MENU_OPTIONS = {
+    "containers": (
+        ("Start All", "s"),
+        ("Stop All", "t"),
+        ("Restart All", "r"),
+        ("Remove All", "d"),
+    ),
+    "images": (("Remove All", "d"), ("Prune Unused", "p")),
+    "volumes": (("Remove All", "d"),),
+    "networks": (("Remove All", "d"),),
+    "compose": (
+        ("Up All", "U"),
+        ("Down All", "D"),
+        ("Restart All", "X"),
+        ("Pull All", "p"),
+        ("Remove All", "r"),
+    ),
+}
+
+# List row decorations: cursor marker plus bulk checkbox, keyed by
+# (is_cursor, is_checked); outside bulk mode is_checked is always False.
+_BULK_PREFIXES = {
+    (True, True): "> [x] ",
+    (True, False): "> [ ] ",
+    (False, True): "  [x] ",
+    (False, False): "  [ ] ",
+}
+_PLAIN_PREFIXES = {(True, False): ">   ", (False, False): "    "}
+
+
+_UTF8_DECODER = codecs.getincrementaldecoder("utf-8")
+
+
+class LogTailWorker(threading.Thread):
+    """Follows `docker logs -f` for one container into a bounded ring buffer.
+
+    The UI never waits on Docker for logs: it calls `follow()` with the
+    selected container and copies `snapshot()` only when `version` moved.
+    """
+
+    def __init__(self, backend: DockerBackend, tail: int = 100, max_lines: int = 200) -> None:
+        super().__init__(daemon=True)
+        self.backend = backend
+        self.tail = tail
+        self.running = True
+        self._lines: deque[str] = deque(maxlen=max_lines)
+        self._version = 0
+        self._lock = threading.Lock()
+        self._target: Optional[str] = None
+        self._current: Optional[str] = None
+        self._process: Optional[subprocess.Popen] = None
+        self._restart_at = 0.0
+        self._replace_on_next = False
+        self._partial = ""
+        self._decoder = _UTF8_DECODER(errors="replace")
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def follow(self, container_id: Optional[str]) -> None:
+        self._target = container_id
+
+    def snapshot(self) -> tuple[int, list[str]]:
+        with self._lock:
+            return self._version, list(self._lines)
+
+    def stop(self) -> None:
+        self.running = False
+        process = self._process
+        if process:
+            # Don't leave `docker logs -f` behind if the daemon thread is
+            # killed at interpreter exit before it can clean up.
+            process.terminate()
+
+    def _set_lines(self, lines: list[str]) -> None:
+        with self._lock:
+            self._lines.clear()
+            self._lines.extend(lines)
+            self._version += 1
+
+    def _extend(self, lines: list[str]) -> None:
+        with self._lock:
+            if self._replace_on_next:
+                # Restarted stream re-sends the tail; swap it in atomically.
+                self._lines.clear()
+                self._replace_on_next = False
+            self._lines.extend(lines)
+            self._version += 1
+
+    def _feed(self, chunk: bytes, final: bool = False) -> None:
+        # Split raw pipe output into lines, holding back a trailing partial line.
+        text = self._partial + self._decoder.decode(chunk, final)
+        lines = text.split("\n")
+        self._partial = "" if final else lines.pop()
+        lines = [line.rstrip() for line in lines]
+        if final and lines and not lines[-1]:
+            lines.pop()
+        if lines:
+            self._extend(lines)
+
+    def _close_process(self) -> None:
+        process, self._process = self._process, None
+        if process:
+            process.terminate()
+            try:
+                process.wait(timeout=0.2)
+            except Exception:
+                process.kill()
+            if process.stdout:
+                process.stdout.close()
+
+    def _start(self, container_id: str) -> None:
+        self._partial = ""
+        self._decoder = _UTF8_DECODER(errors="replace")
+        try:
+            self._process = self.backend.get_log_stream_process(container_id, tail=self.tail)
+        except Exception:
+            # No docker CLI: fetch through the SDK instead, and poll again
+            # through the restart timer so the pane keeps updating.
+            self._restart_at = time.monotonic() + 1.0
+            self._set_lines(self.backend.get_logs(container_id, self.tail))
+
+    def _stream_ended(self) -> None:
+        # Container stopped; retry later in case it restarts.
+        self._feed(b"", final=True)
+        self._close_process()
+        self._restart_at = time.monotonic() + 2.0
+
+    def run(self) -> None:
+        while self.running:
+            try:
+                target = self._target
+                if target != self._current:
+                    self._close_process()
+                    self._current = target
+                    self._replace_on_next = False
+                    self._set_lines([])
+                    if target:
+                        self._start(target)
+
+                process = self._process
+                if process is None:
+                    if self._current and self._restart_at and time.monotonic() >= self._restart_at:
+                        self._restart_at = 0.0
+                        self._replace_on_next = True
+                        self._start(self._current)
+                    time.sleep(0.2)
+                    continue
+
+                if process.stdout is None:
+                    self._close_process()
+                    continue
+                # Read the raw fd rather than the text wrapper: a buffered
+                # readline() would hide already-read lines from select().
+                fd = process.stdout.fileno()
+                ready, _, _ = select.select([fd], [], [], 0.1)
+                if not ready:
+                    if process.poll() is not None:
+                        self._stream_ended()
+                    continue
+                chunk = os.read(fd, 65536)
+                if chunk:
+                    self._feed(chunk)
+                else:
+                    self._stream_ended()
+            except (ValueError, OSError):
+                # File descriptor closed underneath us.
+                self._close_process()
+            except Exception:
+                time.sleep(1.0)
+
+        self._close_process()
+
+
 class ConfirmScreen(ModalScreen[bool]):
     def __init__(self, question: str) -> None:
         super().__init__()
@@ -77,11 +423,14 @@ class ActionMenuScreen(ModalScreen[Optional[str]]):
         Binding("escape", "cancel", "Cancel", show=False),
     ]
 
-    def __init__(self, title: str, options: list[tuple[str, str]]) -> None:
+    def __init__(self, title: str, options: Sequence[tuple[str, str]]) -> None:
         super().__init__()
         self.menu_title = title
         self.options = options
         self.index = 0
+        self._labels = tuple(f"{label} ({key})" for label, key in options)
+        # Menu text per cursor position, built on first visit.
+        self._rendered: dict[int, str] = {}
 
     def compose(self) -> ComposeResult:
         yield Vertical(
@@ -95,11 +444,14 @@ class ActionMenuScreen(ModalScreen[Optional[str]]):
         self._render_options()
 
     def _render_options(self) -> None:
-        lines = []
-        for idx, (label, key) in enumerate(self.options):
-            marker = ">" if idx == self.index else " "
-            lines.append(f"{marker} {label} ({key})")
-        self.query_one("#menu_options", Static).update("\n".join(lines))
+        text = self._rendered.get(self.index)
+        if text is None:
+            text = "\n".join(
+                ("> " if idx == self.index else "  ") + label
+                for idx, label in enumerate(self._labels)
+            )
+            self._rendered[self.index] = text
+        self.query_one("#menu_options", Static).update(text)
 
     def action_move_up(self) -> None:
         self.index = (self.index - 1) % len(self.options)
@@ -264,6 +616,8 @@ class TockerTextualApp(App[None]):
         self.networks: list[Any] = []
         self.composes: list[Any] = []
         self.logs: list[str] = []
+        self._logs_version = -1
+        self._log_tail = LogTailWorker(self.backend)
         self.self_usage = ""
 
         self.bulk_selected: dict[str, set[str]] = {
@@ -273,6 +627,10 @@ class TockerTextualApp(App[None]):
             "networks": set(),
             "compose": set(),
         }
+        # Bumped on every bulk_selected mutation; keys the frozen render snapshot.
+        self._selection_version = 0
+        self._selection_frozen: frozenset[str] = frozenset()
+        self._selection_frozen_key: Optional[tuple[str, int]] = None
 
         self._last_containers = 0.0
         self._last_others = 0.0
@@ -280,6 +638,18 @@ class TockerTextualApp(App[None]):
         self._force_refresh = True
         self._refresh_in_flight = False
         self._syncing_tabs = False
+        # Bumped whenever a refresh changes resource data; part of pane signatures.
+        self._data_version = 0
+        self._tab_items: list[Any] = []
+        self._tab_items_key: tuple = ()
+        self._region_sigs: dict[str, tuple] = {}
+        # Pane widgets, kept from compose() instead of queried per render.
+        self._panes: dict[str, Static] = {}
+        self._row_cache: dict[tuple, str] = {}
+        self._row_cache_layout: tuple[str, int] = ("", 0)
+        self._key_to_action = config_manager.get_key_action_map(
+            ["quit", "select_toggle", "select_all", "select_none"]
+        )
 
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
@@ -292,25 +662,29 @@ class TockerTextualApp(App[None]):
             Tab("STATS", id="stats"),
             id="tabs",
         )
+        self._panes = {
+            region: Static("", id=region, markup=False)
+            for region in ("list", "info", "logs", "status")
+        }
         yield Vertical(
-            Horizontal(
-                Static("", id="list", markup=False),
-                Static("", id="info", markup=False),
-                id="top",
-            ),
-            Static("", id="logs", markup=False),
+            Horizontal(self._panes["list"], self._panes["info"], id="top"),
+            self._panes["logs"],
             id="main",
         )
-        yield Static("", id="status", markup=False)
+        yield self._panes["status"]
         yield Footer()
 
     def on_mount(self) -> None:
+        self._log_tail.start()
         self.set_interval(0.25, self._tick)
         self._apply_responsive_layout()
         self.query_one("#tabs", Tabs).active = self.selected_tab
         self._apply_panel_mode()
         self._render()
 
+    def on_unmount(self) -> None:
+        self._log_tail.stop()
+
     def on_resize(self, event: events.Resize) -> None:
         self._apply_responsive_layout()
         self._apply_panel_mode()
@@ -328,6 +702,16 @@ class TockerTextualApp(App[None]):
 
     def _get_tab_items(self, tab: Optional[str] = None) -> list[Any]:
         tab = tab or self.selected_tab
+        # A keypress and the render it triggers ask for the same view several
+        # times; sort and filter once per state instead. Callers must treat the
+        # returned list as read-only.
+        key = (tab, self.sort_mode, self.filter_text, self._data_version)
+        if key != self._tab_items_key:
+            self._tab_items = self._build_tab_items(tab)
+            self._tab_items_key = key
+        return self._tab_items
+
+    def _build_tab_items(self, tab: str) -> list[Any]:
         if tab == "containers":
             items = list(self.containers)
             if self.sort_mode == "name":
@@ -335,12 +719,7 @@ class TockerTextualApp(App[None]):
             elif self.sort_mode == "status":
                 items.sort(key=lambda x: x.status)
             elif self.sort_mode == "cpu":
-                def get_cpu(c: Any) -> float:
-                    try:
-                        return float(str(c.cpu_percent).strip("%"))
-                    except Exception:
-                        return -1.0
-                items.sort(key=get_cpu, reverse=True)
+                items.sort(key=_cpu_sort_key, reverse=True)
         elif tab == "images":
             items = sorted(self.images, key=lambda x: x.short_id)
         elif tab == "volumes":
@@ -356,20 +735,20 @@ class TockerTextualApp(App[None]):
             return items
 
         f = self.filter_text.lower()
-        filtered: list[Any] = []
-        for item in items:
-            if tab == "containers" and (f in item.name.lower() or f in item.image.lower()):
-                filtered.append(item)
-            elif tab == "images" and (f in item.short_id.lower() or any(f in t.lower() for t in item.tags)):
-                filtered.append(item)
-            elif tab in ("volumes", "networks", "compose") and f in item.name.lower():
-                filtered.append(item)
-        return filtered
+        matches = FILTER_MATCHERS.get(tab)
+        if matches is None:
+            return []
+        return [item for item in items if matches(f, item)]
 
     def _item_id(self, tab: str, item: Any) -> str:
-        if tab in ("containers", "images", "networks"):
-            return item.id
-        return item.name
+        return _ID_GETTERS[tab](item)
+
+    def _selection_snapshot(self) -> frozenset[str]:
+        key = (self.selected_tab, self._selection_version)
+        if key != self._selection_frozen_key:
+            self._selection_frozen_key = key
+            self._selection_frozen = frozenset(self.bulk_selected.get(self.selected_tab, ()))
+        return self._selection_frozen
 
     def _selected_item(self) -> Optional[Any]:
         items = self._get_tab_items()
@@ -391,9 +770,12 @@ class TockerTextualApp(App[None]):
         if force or now - self._last_containers >= 1.0:
             containers_task = asyncio.to_thread(self.backend.get_containers)
             usage_task = asyncio.to_thread(self.backend.get_self_usage)
-            new_containers, self.self_usage = await asyncio.gather(
+            new_containers, self_usage = await asyncio.gather(
                 containers_task, usage_task
             )
+            if self_usage != self.self_usage:
+                self.self_usage = self_usage
+                self._data_version += 1
             # Preserve displayed CPU/MEM between container list refreshes to avoid visual reset/flicker.
             previous_stats = {
                 c.id: (getattr(c, "cpu_percent", "--"), getattr(c, "ram_usage", "--"))
@@ -404,10 +786,13 @@ class TockerTextualApp(App[None]):
                     c.cpu_percent, c.ram_usage = previous_stats[c.id]
                 elif c.status != "running":
                     c.cpu_percent, c.ram_usage = "0.0%", "0.0MB"
-            self.containers = new_containers
+            if new_containers != self.containers:
+                self.containers = new_containers
+                self._data_version += 1
             self._last_containers = now
 
         if force or now - self._last_container_stats >= 2.0:
+            previous = [(c.cpu_percent, c.ram_usage) for c in self.containers]
             running = [c for c in self.containers if c.status == "running"]
             if running:
                 stats = await asyncio.gather(
@@ -423,62 +808,32 @@ class TockerTextualApp(App[None]):
                 if c.status != "running":
                     c.cpu_percent = "0.0%"
                     c.ram_usage = "0.0MB"
+            if previous != [(c.cpu_percent, c.ram_usage) for c in self.containers]:
+                self._data_version += 1
             self._last_container_stats = now
 
         if force or now - self._last_others >= 5.0:
-            (
-                self.images,
-                self.volumes,
-                self.networks,
-                self.composes,
-            ) = await asyncio.gather(
+            others = await asyncio.gather(
                 asyncio.to_thread(self.backend.get_images),
                 asyncio.to_thread(self.backend.get_volumes),
                 asyncio.to_thread(self.backend.get_networks),
                 asyncio.to_thread(self.backend.get_composes),
             )
+            if others != [self.images, self.volumes, self.networks, self.composes]:
+                self.images, self.volumes, self.networks, self.composes = others
+                self._data_version += 1
             self._last_others = now
 
         self._normalize_selection()
 
-        if self.selected_tab == "containers":
-            selected = self._selected_item()
-            if selected:
-                self.logs = await asyncio.to_thread(
-                    self.backend.get_logs, selected.id, 100
-                )
+        selected = self._selected_item() if self.selected_tab == "containers" else None
+        self._log_tail.follow(selected.id if selected else None)
+        if self._log_tail.version != self._logs_version:
+            self._logs_version, self.logs = self._log_tail.snapshot()
 
     def _set_message(self, message: str) -> None:
         self.message = message
 
-    def _row(self, tab: str, item: Any) -> str:
-        if tab == "containers":
-            cpu = getattr(item, "cpu_percent", "--")
-            ram = getattr(item, "ram_usage", "--")
-            return f"{item.project[:12]:12} {item.name[:20]:20} {item.status[:10]:10} {str(cpu):7} {str(ram):10} {item.image[:28]}"
-        if tab == "images":
-            return f"{item.short_id[:15]:15} {item.size_mb:8.1f}MB {item.created[:10]:10} {str(item.tags)[:45]}"
-        if tab == "volumes":
-            return f"{item.name[:20]:20} {item.driver[:10]:10} {item.mountpoint[:45]}"
-        if tab == "networks":
-            return f"{item.name[:20]:20} {item.driver[:10]:10} {item.subnet[:40]}"
-        if tab == "compose":
-            return f"{item.name[:20]:20} {item.status[:10]:10} {item.config_files[:45]}"
-        return ""
-
-    def _header(self, tab: str) -> str:
-        if tab == "containers":
-            return "PROJECT      NAME                 STATUS     CPU     MEM        IMAGE"
-        if tab == "images":
-            return "SHORT ID        SIZE      CREATED    TAGS"
-        if tab == "volumes":
-            return "NAME                 DRIVER     MOUNTPOINT"
-        if tab == "networks":
-            return "NAME                 DRIVER     SUBNET"
-        if tab == "compose":
-            return "NAME                 STATUS     CONFIG FILES"
-        return ""
-
     def _render_list(self) -> str:
         if self.selected_tab == "stats":
             stats = StatsCollector().collect_stats(
@@ -509,28 +864,46 @@ class TockerTextualApp(App[None]):
             )
 
         items = self._get_tab_items()
-        list_height = max(1, self.query_one("#list", Static).size.height - 3)
+        list_size = self._panes["list"].size
+        list_height = max(1, list_size.height - 3)
         if self.selected_index < self.scroll_offset:
             self.scroll_offset = self.selected_index
         elif self.selected_index >= self.scroll_offset + list_height:
             self.scroll_offset = self.selected_index - list_height + 1
 
-        visible = items[self.scroll_offset : self.scroll_offset + list_height]
-
-        lines = [self._header(self.selected_tab), ""]
-        selected_ids = self.bulk_selected.get(self.selected_tab, set())
-        for i, item in enumerate(visible):
-            actual_idx = self.scroll_offset + i
-            marker = ">" if actual_idx == self.selected_index else " "
-
-            if self.bulk_select_mode and self.selected_tab in self.bulk_selected:
-                item_id = self._item_id(self.selected_tab, item)
-                checkbox = "[x]" if item_id in selected_ids else "[ ]"
-                prefix = f"{marker} {checkbox}"
-            else:
-                prefix = f"{marker}  "
+        offset = self.scroll_offset
+        visible = items[offset : offset + list_height]
 
-            lines.append(f"{prefix} {self._row(self.selected_tab, item)}")
+        tab = self.selected_tab
+        lines = [_HEADERS[tab], ""]
+        layout = (tab, list_size.width)
+        format_row = _layout_for_tab(*layout).__mod__
+        fields_of = _ROW_FIELDS[tab]
+        # Only rows whose fields changed since the last render are reformatted;
+        # the cache is rebuilt each time so it never outgrows the visible page.
+        previous = self._row_cache if self._row_cache_layout == layout else {}
+        row_cache: dict[tuple, str] = {}
+        selected_ids = self._selection_snapshot()
+        bulk = self.bulk_select_mode and tab in self.bulk_selected
+        # Row state is gathered column-wise up front (field tuples, selection
+        # flags) so the loop below does no attribute lookups per row.
+        rows = list(map(fields_of, visible))
+        if bulk:
+            checked = [x in selected_ids for x in map(_ID_GETTERS[tab], visible)]
+        else:
+            checked = [False] * len(rows)
+        prefixes = _BULK_PREFIXES if bulk else _PLAIN_PREFIXES
+        cursor = self.selected_index - offset
+        cached = previous.get
+        append = lines.append
+        for i, (fields, is_checked) in enumerate(zip(rows, checked)):
+            text = cached(fields)
+            if text is None:
+                text = format_row(fields)
+            row_cache[fields] = text
+            append(prefixes[i == cursor, is_checked] + text)
+        self._row_cache = row_cache
+        self._row_cache_layout = layout
 
         if not visible:
             lines.append("(no items)")
@@ -545,69 +918,64 @@ class TockerTextualApp(App[None]):
         if not selected:
             return "No selection"
 
-        if self.selected_tab == "containers":
-            details = [
-                f"ID: {selected.id}",
-                f"Name: {selected.name}",
-                f"Status: {selected.status}",
-                f"Image: {selected.image}",
-            ]
-            return "\n".join(details)
-
-        if self.selected_tab == "images":
-            return "\n".join(
-                [
-                    f"ID: {selected.id}",
-                    f"Tags: {selected.tags}",
-                    f"Size: {selected.size_mb:.1f}MB",
-                    f"Created: {selected.created}",
-                ]
-            )
-
-        if self.selected_tab == "volumes":
-            return "\n".join(
-                [
-                    f"Name: {selected.name}",
-                    f"Driver: {selected.driver}",
-                    f"Mountpoint: {selected.mountpoint}",
-                ]
-            )
-
-        if self.selected_tab == "networks":
-            return "\n".join(
-                [
-                    f"ID: {selected.id}",
-                    f"Name: {selected.name}",
-                    f"Driver: {selected.driver}",
-                    f"Subnet: {selected.subnet}",
-                ]
-            )
-
-        return "\n".join(
-            [
-                f"Project: {selected.name}",
-                f"Status: {selected.status}",
-                f"Config: {selected.config_files}",
-            ]
-        )
+        return _INFO_RENDERERS[self.selected_tab](selected)
 
     def _render_logs(self) -> str:
         if self.selected_tab != "containers":
             return "Logs are available in CONTAINERS tab."
         if not self.logs:
             return "(no logs)"
-        return "\n".join(self.logs[-200:])
+        # The tail worker's ring buffer is already bounded to the pane's
+        # backlog, so its snapshot is joined as-is without another copy.
+        return "\n".join(self.logs)
 
     def _render_status(self) -> str:
         filter_part = f"FILTER: {self.filter_text}" if self.is_filtering else ""
         bulk_part = "BULK ON" if self.bulk_select_mode else "BULK OFF"
         return f"{bulk_part}  {filter_part}  {self.message}".strip()
 
+    def _update_region(self, region: str, sig: tuple, render: Any) -> None:
+        # Each pane is re-rendered only when the inputs it depends on changed.
+        if self._region_sigs.get(region) == sig:
+            return
+        self._region_sigs[region] = sig
+        # Panes are markup=False, so text is shown verbatim without escaping.
+        self._panes[region].update(render())
+
     def _render(self) -> None:
-        self.query_one("#list", Static).update(rich_escape(self._render_list()))
-        self.query_one("#info", Static).update(rich_escape(self._render_info()))
-        self.query_one("#logs", Static).update(rich_escape(self._render_logs()))
-        self.query_one("#status", Static).update(rich_escape(self._render_status()))
+        # Pane updates inside the batch are flushed to the terminal as one frame.
+        with self.batch_update():
+            tab = self.selected_tab
+            view = (
+                tab,
+                self.selected_index,
+                self.filter_text,
+                self.sort_mode,
+                self._data_version,
+            )
+            self._update_region(
+                "list",
+                view
+                + (
+                    self.scroll_offset,
+                    self._panes["list"].size,
+                    self.bulk_select_mode,
+                    self._selection_version,
+                ),
+                self._render_list,
+            )
+            self._update_region("info", view, self._render_info)
+            self._update_region("logs", (tab, self._logs_version), self._render_logs)
+            self._update_region(
+                "status",
+                (
+                    self.bulk_select_mode,
+                    self.is_filtering,
+                    self.filter_text,
+                    self.message,
+                ),
+                self._render_status,
+            )
 
     async def _tick(self) -> None:
         if self._refresh_in_flight:
@@ -629,7 +997,7 @@ class TockerTextualApp(App[None]):
         result = await self.push_screen_wait(InputScreen(prompt))
         return result
 
-    async def _choose_action(self, options: list[tuple[str, str]]) -> Optional[str]:
+    async def _choose_action(self, options: Sequence[tuple[str, str]]) -> Optional[str]:
         return await self.push_screen_wait(ActionMenuScreen("Actions", options))
 
     async def _run_backend(self, func: Any, *args: Any) -> Any:
@@ -1042,24 +1410,8 @@ class TockerTextualApp(App[None]):
         if self.selected_tab == "stats":
             return
 
-        if self.bulk_select_mode:
-            options_map = {
-                "containers": [("Start All", "s"), ("Stop All", "t"), ("Restart All", "r"), ("Remove All", "d")],
-                "images": [("Remove All", "d"), ("Prune Unused", "p")],
-                "volumes": [("Remove All", "d")],
-                "networks": [("Remove All", "d")],
-                "compose": [("Up All", "U"), ("Down All", "D"), ("Restart All", "X"), ("Pull All", "p"), ("Remove All", "r")],
-            }
-        else:
-            options_map = {
-                "containers": [("Start", "s"), ("Stop", "t"), ("Restart", "r"), ("Pause/Unpause", "z"), ("Rename", "n"), ("Commit", "k"), ("Copy To", "cp"), ("Exec Shell", "x"), ("Logs", "l"), ("Inspect", "i"), ("Delete", "d")],
-                "images": [("Run", "R"), ("Pull/Update", "p"), ("Save (tar)", "S"), ("Load (tar)", "L"), ("History", "H"), ("Build", "B"), ("Inspect", "i"), ("Delete", "d")],
-                "volumes": [("Create", "C"), ("Inspect", "i"), ("Delete", "d")],
-                "networks": [("Inspect", "i"), ("Delete", "d")],
-                "compose": [("Up", "U"), ("Down", "D"), ("Restart", "X"), ("Pull", "p"), ("Logs", "l"), ("Remove", "r"), ("Pause", "P")],
-            }
-
-        options = options_map.get(self.selected_tab, [])
+        options_map = _BULK_MENU_OPTIONS if self.bulk_select_mode else _MENU_OPTIONS
+        options = options_map.get(self.selected_tab, ())
         if not options:
             return
 
@@ -1164,6 +1516,7 @@ class TockerTextualApp(App[None]):
             selected.remove(item_id)
         else:
             selected.add(item_id)
+        self._selection_version += 1
         self._render()
 
     def action_select_all(self) -> None:
@@ -1172,14 +1525,15 @@ class TockerTextualApp(App[None]):
         items = self._get_tab_items()
         selected = self.bulk_selected.setdefault(self.selected_tab, set())
         selected.clear()
-        for item in items:
-            selected.add(self._item_id(self.selected_tab, item))
+        selected.update(map(_ID_GETTERS[self.selected_tab], items))
+        self._selection_version += 1
         self._render()
 
     def action_select_none(self) -> None:
         if not self.bulk_select_mode:
             return
         self.bulk_selected.setdefault(self.selected_tab, set()).clear()
+        self._selection_version += 1
         self._render()
 
     def action_cycle_sort(self) -> None:
@@ -1230,7 +1584,8 @@ class TockerTextualApp(App[None]):
 
     async def on_key(self, event: events.Key) -> None:
         # Prefer configured keybindings for quit/help/filter/toggle actions.
-        if not self.is_filtering and config_manager.is_key_binding(event.key, "quit"):
+        action = self._key_to_action.get(event.key)
+        if not self.is_filtering and action == "quit":
             self.exit()
             return
 
@@ -1249,16 +1604,9 @@ class TockerTextualApp(App[None]):
             return
 
         # Handle symbolic keybinding names from config (e.g. "space").
-        if config_manager.is_key_binding(event.key, "select_toggle"):
-            self.action_toggle_select()
-            event.stop()
-            return
-        if config_manager.is_key_binding(event.key, "select_all"):
-            self.action_select_all()
-            event.stop()
-            return
-        if config_manager.is_key_binding(event.key, "select_none"):
-            self.action_select_none()
+        handler = _CONFIG_KEY_HANDLERS.get(action) if action else None
+        if handler:
+            getattr(self, handler)()
             event.stop()
             return
 
@@ -0,0 +1,48 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tockerdui.backend import DockerBackend
+from tockerdui.state import StateManager
+
+
+@pytest.fixture(scope="module")
+def state_mgr():
+    """One StateManager shared by every test in a module."""
+    return StateManager()
+
+
+@pytest.fixture
+def clean_state(state_mgr):
+    """The shared StateManager, reset to a fresh AppState for this test."""
+    state_mgr.reset()
+    return state_mgr
+
+
+@pytest.fixture
+def empty_backend():
+    """A DockerBackend double whose resource getters return empty lists."""
+    return MagicMock(
+        spec=DockerBackend,
+        **{
+            f"get_{name}.return_value": []
+            for name in ("containers", "images", "volumes", "networks", "composes")
+        },
+        **{"check_for_updates.return_value": True},
+    )
+
+
+@pytest.fixture(scope="class")
+def _docker_from_env():
+    with patch("tockerdui.backend.docker.from_env") as from_env:
+        yield from_env
+
+
+@pytest.fixture
+def mock_docker_env(_docker_from_env):
+    """``docker.from_env`` as seen by the backend, patched once per test class.
+
+    Configured return values and side effects are cleared before each test.
+    """
+    _docker_from_env.reset_mock(return_value=True, side_effect=True)
+    return _docker_from_env
@@ -1,7 +1,6 @@
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 from tockerdui.backend import DockerBackend
-from tockerdui.model import ContainerInfo
 
 @pytest.fixture
 def mock_docker(mocker):
@@ -0,0 +1,22 @@
+from unittest.mock import patch
+
+from tockerdui.config import AppConfig, config_manager
+
+
+def test_key_action_map_matches_is_key_binding():
+    with patch.object(config_manager, "_config", AppConfig()):
+        config_manager._config.keybindings.select_toggle = "space"
+        config_manager._config.keybindings.select_none = "enter"
+        key_map = config_manager.get_key_action_map(
+            ["quit", "select_toggle", "select_all", "select_none"]
+        )
+        for key in ("q", " ", "a", "\n", "\r", "x"):
+            expected = next(
+                (
+                    action
+                    for action in ("quit", "select_toggle", "select_all", "select_none")
+                    if config_manager.is_key_binding(key, action)
+                ),
+                None,
+            )
+            assert key_map.get(key) == expected
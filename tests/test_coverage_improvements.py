@@ -3,17 +3,18 @@ Additional tests for improved code coverage.
 
 Includes:
 - Backend error handling and @docker_safe decorator
+- Cache manager bookkeeping
 - Path validation in copy_to_container
 - Compose actions
 - State manager filtering and sorting
 """
 
+import os
 import pytest
 from unittest.mock import MagicMock, patch
 from tockerdui.backend import DockerBackend
-from tockerdui.state import StateManager
-from tockerdui.model import ContainerInfo, ImageInfo, VolumeInfo, NetworkInfo, ComposeInfo
-from tockerdui.cache import cache_manager
+from tockerdui.model import ContainerInfo, ImageInfo
+from tockerdui.cache import CacheManager, cache_manager
 import subprocess
 
 
@@ -22,13 +23,14 @@ class TestBackendErrorHandling:
 
     def setup_method(self):
         """Clear cache before each test."""
-        cache_manager.invalidate()
+        if not cache_manager.is_empty():
+            cache_manager.invalidate()
 
     def teardown_method(self):
         """Clear cache after each test."""
-        cache_manager.invalidate()
+        if not cache_manager.is_empty():
+            cache_manager.invalidate()
 
-    @patch("tockerdui.backend.docker.from_env")
     def test_get_containers_no_docker_connection(self, mock_docker_env):
         """Test graceful handling when Docker is not available."""
         mock_docker_env.side_effect = Exception("Docker daemon not running")
@@ -40,7 +42,6 @@ class TestBackendErrorHandling:
         results = backend.get_containers()
         assert results == []
 
-    @patch("tockerdui.backend.docker.from_env")
     def test_start_container_docker_error(self, mock_docker_env):
         """Test that container start handles Docker errors gracefully."""
         mock_client = MagicMock()
@@ -54,7 +55,6 @@ class TestBackendErrorHandling:
         result = backend.start_container("nonexistent")
         assert result is None
 
-    @patch("tockerdui.backend.docker.from_env")
     def test_get_images_empty(self, mock_docker_env):
         """Test getting images when none exist."""
         mock_client = MagicMock()
@@ -65,7 +65,6 @@ class TestBackendErrorHandling:
         results = backend.get_images()
         assert results == []
 
-    @patch("tockerdui.backend.docker.from_env")
     def test_remove_container_force(self, mock_docker_env):
         """Test that remove_container uses force=True."""
         mock_client = MagicMock()
@@ -79,74 +78,51 @@ class TestBackendErrorHandling:
         mock_container.remove.assert_called_once_with(force=True)
 
 
-class TestPathValidation:
-    """Test path validation in copy_to_container."""
-
-    @patch("tockerdui.backend.docker.from_env")
-    @patch("os.path.exists")
-    def test_copy_rejects_absolute_src_path(self, mock_exists, mock_docker_env):
-        """Test that absolute paths are rejected for security."""
-        mock_client = MagicMock()
-        mock_docker_env.return_value = mock_client
-        
-        backend = DockerBackend()
-        # Absolute path should be rejected
-        result = backend.copy_to_container("container", "/etc/passwd", "/tmp")
-        assert result is None
-        # Should not reach put_archive
-        mock_client.containers.get.assert_not_called()
+class TestCacheManager:
+    """Test cache manager bookkeeping."""
 
-    @patch("tockerdui.backend.docker.from_env")
-    @patch("os.path.exists")
-    def test_copy_rejects_home_src_path(self, mock_exists, mock_docker_env):
-        """Test that home directory paths are rejected."""
-        mock_client = MagicMock()
-        mock_docker_env.return_value = mock_client
-        
-        backend = DockerBackend()
-        result = backend.copy_to_container("container", "~/secrets.txt", "/tmp")
-        assert result is None
-        mock_client.containers.get.assert_not_called()
+    def test_is_empty_tracks_entries(self):
+        """Test that is_empty reflects entries being set and invalidated."""
+        cache = CacheManager()
+        assert cache.is_empty()
+        cache.set("containers:all", [])
+        assert not cache.is_empty()
+        cache.invalidate()
+        assert cache.is_empty()
 
-    @patch("tockerdui.backend.docker.from_env")
-    @patch("os.path.exists")
-    def test_copy_rejects_path_traversal_src(self, mock_exists, mock_docker_env):
-        """Test that path traversal attempts are rejected."""
-        mock_client = MagicMock()
-        mock_docker_env.return_value = mock_client
-        
-        backend = DockerBackend()
-        result = backend.copy_to_container("container", "../../etc/passwd", "/tmp")
-        assert result is None
-        mock_client.containers.get.assert_not_called()
 
-    @patch("tockerdui.backend.docker.from_env")
-    @patch("os.path.exists")
-    def test_copy_rejects_path_traversal_dest(self, mock_exists, mock_docker_env):
-        """Test that path traversal in dest is rejected."""
-        mock_client = MagicMock()
-        mock_docker_env.return_value = mock_client
-        mock_exists.return_value = True
-        
-        backend = DockerBackend()
-        result = backend.copy_to_container("container", "file.txt", "../../etc/")
-        assert result is None
-        mock_client.containers.get.assert_not_called()
+class TestPathValidation:
+    """Test path validation in copy_to_container."""
 
-    @patch("tockerdui.backend.docker.from_env")
+    @pytest.mark.parametrize(
+        "src,dest,exists",
+        [
+            ("/etc/passwd", "/tmp", True),
+            ("~/secrets.txt", "/tmp", True),
+            ("../../etc/passwd", "/tmp", True),
+            ("file.txt", "../../etc/", True),
+            ("missing.txt", "/tmp", False),
+        ],
+        ids=[
+            "absolute-src",
+            "home-src",
+            "traversal-src",
+            "traversal-dest",
+            "nonexistent-src",
+        ],
+    )
     @patch("os.path.exists")
-    def test_copy_rejects_nonexistent_src(self, mock_exists, mock_docker_env):
-        """Test that nonexistent source files are rejected."""
+    def test_copy_rejects_unsafe_paths(self, mock_exists, mock_docker_env, src, dest, exists):
+        """Test that unsafe or missing paths are rejected before reaching Docker."""
         mock_client = MagicMock()
         mock_docker_env.return_value = mock_client
-        mock_exists.return_value = False
+        mock_exists.return_value = exists
         
         backend = DockerBackend()
-        result = backend.copy_to_container("container", "missing.txt", "/tmp")
+        result = backend.copy_to_container("container", src, dest)
         assert result is None
         mock_client.containers.get.assert_not_called()
 
-    @patch("tockerdui.backend.docker.from_env")
     @patch("os.path.exists")
     def test_copy_accepts_valid_relative_path(self, mock_exists, mock_docker_env):
         """Test that valid relative paths are accepted."""
@@ -167,7 +143,6 @@ class TestPathValidation:
 class TestComposeActions:
     """Test Docker Compose operations."""
 
-    @patch("tockerdui.backend.docker.from_env")
     @patch("subprocess.run")
     def test_compose_up(self, mock_run, mock_docker_env):
         """Test compose_up calls correct subprocess."""
@@ -185,7 +160,6 @@ class TestComposeActions:
         assert "myproject" in args
         assert "up" in args
 
-    @patch("tockerdui.backend.docker.from_env")
     @patch("subprocess.run")
     def test_compose_down(self, mock_run, mock_docker_env):
         """Test compose_down calls correct subprocess."""
@@ -199,7 +173,6 @@ class TestComposeActions:
         args = mock_run.call_args[0][0]
         assert "down" in args
 
-    @patch("tockerdui.backend.docker.from_env")
     @patch("subprocess.run")
     def test_compose_remove(self, mock_run, mock_docker_env):
         """Test compose_remove calls with -v flag."""
@@ -213,7 +186,6 @@ class TestComposeActions:
         args = mock_run.call_args[0][0]
         assert "-v" in args  # Volume removal flag
 
-    @patch("tockerdui.backend.docker.from_env")
     @patch("subprocess.run")
     def test_compose_pause(self, mock_run, mock_docker_env):
         """Test compose_pause calls correct subprocess."""
@@ -227,7 +199,6 @@ class TestComposeActions:
         args = mock_run.call_args[0][0]
         assert "pause" in args
 
-    @patch("tockerdui.backend.docker.from_env")
     @patch("subprocess.run")
     def test_compose_error_handling(self, mock_run, mock_docker_env):
         """Test that compose errors are handled gracefully."""
@@ -241,7 +212,6 @@ class TestComposeActions:
         result = backend.compose_up("badproject")
         assert result[0] is False
 
-    @patch("tockerdui.backend.docker.from_env")
     def test_get_composes_includes_discovered_inactive(self, mock_docker_env):
         """Projects discovered on disk should appear as inactive if not running."""
         cache_manager.invalidate("composes")
@@ -262,7 +232,6 @@ class TestComposeActions:
         assert result[0].status == "inactive"
         assert result[0].config_files == "/tmp/myproj/docker-compose.yml"
 
-    @patch("tockerdui.backend.docker.from_env")
     def test_get_composes_merges_running_with_discovered_path(self, mock_docker_env):
         """Running projects with missing config file should use discovered path."""
         cache_manager.invalidate("composes")
@@ -294,9 +263,9 @@ class TestComposeActions:
 class TestStateManagerFiltering:
     """Test state manager filtering and sorting capabilities."""
 
-    def test_filtering_containers(self):
+    def test_filtering_containers(self, clean_state):
         """Test filtering containers by name."""
-        sm = StateManager()
+        sm = clean_state
         
         containers = [
             ContainerInfo(id="1", short_id="1", name="web_app", status="running", image="nginx", project="app"),
@@ -313,9 +282,9 @@ class TestStateManagerFiltering:
         assert len(state.containers) == 1
         assert state.containers[0].name == "web_app"
 
-    def test_clear_filter(self):
+    def test_clear_filter(self, clean_state):
         """Test clearing filter shows all items."""
-        sm = StateManager()
+        sm = clean_state
         
         containers = [
             ContainerInfo(id="1", short_id="1", name="web", status="running", image="nginx", project="app"),
@@ -329,13 +298,24 @@ class TestStateManagerFiltering:
         sm.set_filter_text("")
         assert len(sm.get_snapshot().containers) == 2
 
+    def test_filtering_images_by_tag(self, clean_state):
+        """Test filtering images by tag, ignoring case."""
+        sm = clean_state
+        sm.update_images([
+            ImageInfo("sha256:1", "abc123", ["Nginx:latest"], 10.0, "now"),
+            ImageInfo("sha256:2", "def456", ["redis:7"], 10.0, "now"),
+        ])
+
+        sm.set_filter_text("NGINX")
+        assert [i.short_id for i in sm.get_snapshot().images] == ["abc123"]
+
 
 class TestStateManagerSelection:
     """Test state manager selection and navigation."""
 
-    def test_get_selected_item_id_containers(self):
+    def test_get_selected_item_id_containers(self, clean_state):
         """Test retrieving currently selected container ID."""
-        sm = StateManager()
+        sm = clean_state
         
         containers = [
             ContainerInfo(id="1", short_id="1", name="app1", status="running", image="nginx", project="app"),
@@ -348,16 +328,16 @@ class TestStateManagerSelection:
         assert selected_id is not None
         assert selected_id == "2"
 
-    def test_get_selected_item_id_when_empty(self):
+    def test_get_selected_item_id_when_empty(self, clean_state):
         """Test getting selected item ID when list is empty."""
-        sm = StateManager()
+        sm = clean_state
         
         selected_id = sm.get_selected_item_id()
         assert selected_id is None
 
-    def test_tab_switch_preserves_but_resets_selection_index(self):
+    def test_tab_switch_preserves_but_resets_selection_index(self, clean_state):
         """Test that switching tabs resets selection to 0."""
-        sm = StateManager()
+        sm = clean_state
         
         containers = [
             ContainerInfo(id="1", short_id="1", name="app", status="running", image="nginx", project="app"),
@@ -395,8 +375,10 @@ class TestLoggingConfiguration:
     def test_log_path_supports_xdg(self):
         """Test that log path supports XDG Base Directory."""
         from tockerdui import get_log_path
-        
-        # Should not raise
-        path = get_log_path()
-        assert isinstance(path, str)
-        assert len(path) > 0
+
+        with patch.dict(os.environ, {"XDG_DATA_HOME": "/xdg"}), \
+                patch("pathlib.Path.mkdir") as mkdir:
+            path = get_log_path()
+
+        assert path == "/xdg/tockerdui/logs/tockerdui.log"
+        mkdir.assert_called_once_with(parents=True, exist_ok=True)
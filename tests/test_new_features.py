@@ -1,6 +1,5 @@
-import pytest
-from tockerdui.state import StateManager
-from tockerdui.model import NetworkInfo
+from tockerdui.model import ContainerInfo, NetworkInfo
+
 class MockContainer:
     def __init__(self, id, name):
         self.id = id
@@ -14,8 +13,8 @@ class MockContainer:
     def __lt__(self, other):
         return self.name < other.name
 
-def test_scrolling_logic():
-    sm = StateManager()
+def test_scrolling_logic(clean_state):
+    sm = clean_state
     
     # Simulate 20 items
     items = []
@@ -68,8 +67,8 @@ def test_scrolling_logic():
     assert snap.selected_index == 5
     assert snap.scroll_offset == 5
 
-def test_networks_tab():
-    sm = StateManager()
+def test_networks_tab(clean_state):
+    sm = clean_state
     nets = [NetworkInfo(id="n1", name="net1", driver="bridge", subnet="172.17.0.0/16")]
     sm.update_networks(nets)
     
@@ -82,12 +81,8 @@ def test_networks_tab():
     # Selection ID
     assert sm.get_selected_item_id() == "n1"
 
-def test_filtering_logic():
-    sm = StateManager()
-    
-    # Mock containers
-    # We need a class that has .name and .image (or .short_id/.tags)
-    from tockerdui.model import ContainerInfo
+def test_filtering_logic(clean_state):
+    sm = clean_state
     
     c1 = ContainerInfo(id="1", short_id="1", name="web-app", status="running", image="nginx:latest")
     c2 = ContainerInfo(id="2", short_id="2", name="db-mongo", status="running", image="mongo:4")
@@ -128,8 +123,6 @@ def test_filtering_logic():
     snap = sm.get_snapshot()
     assert len(snap.containers) == 3
 
-from unittest.mock import patch, MagicMock
-
 def test_inspect_logic_construction():
     # Verify we build the correct command string logic
     # We can't easily test the full curses loop here without heavy mocking, 
@@ -1,12 +1,17 @@
+import asyncio
+import subprocess
+import sys
+import time
 from unittest.mock import MagicMock, patch
 
-from tockerdui.model import ContainerInfo
-from tockerdui.state import ListWorker, StateManager
-from tockerdui.textual_app import TockerTextualApp
+from tockerdui import textual_app
+from tockerdui.model import ContainerInfo, ImageInfo
+from tockerdui.state import ListWorker
+from tockerdui.textual_app import LogTailWorker, TockerTextualApp
 
 
-def test_snapshot_includes_bulk_mode_and_error_fields():
-    sm = StateManager()
+def test_snapshot_includes_bulk_mode_and_error_fields(clean_state):
+    sm = clean_state
     sm.toggle_bulk_select_mode()
     sm.set_error("boom")
 
@@ -16,30 +21,45 @@ def test_snapshot_includes_bulk_mode_and_error_fields():
     assert snap.error_timestamp > 0
 
 
-def test_list_worker_skips_update_check_when_auto_update_disabled():
-    sm = StateManager()
-    backend = MagicMock()
-    backend.get_containers.return_value = []
-    backend.get_images.return_value = []
-    backend.get_volumes.return_value = []
-    backend.get_networks.return_value = []
-    backend.get_composes.return_value = []
-    backend.check_for_updates.return_value = True
+def test_list_worker_skips_update_check_when_auto_update_disabled(
+    clean_state, empty_backend
+):
+    sm = clean_state
+    backend = empty_backend
 
     worker = ListWorker(sm, backend)
 
     with patch("tockerdui.state.config_manager.should_auto_update", return_value=False):
-        with patch("time.sleep", side_effect=InterruptedError):
-            try:
-                worker.run()
-            except InterruptedError:
-                pass
+        worker.check_updates()
 
     backend.check_for_updates.assert_not_called()
 
 
-def test_bulk_toggle_container_selection_visible_in_snapshot():
-    sm = StateManager()
+def test_list_worker_run_once_refreshes_due_resources(clean_state, empty_backend):
+    sm = clean_state
+    backend = empty_backend
+    backend.get_containers.return_value = [
+        ContainerInfo(
+            id="c1", short_id="c1", name="web", status="running", image="nginx"
+        )
+    ]
+
+    worker = ListWorker(sm, backend)
+    worker.run_once()
+    assert [c.id for c in sm.get_snapshot().containers] == ["c1"]
+    backend.get_images.assert_called_once()
+
+    # Nothing is due again immediately, unless a refresh is forced.
+    worker.run_once()
+    assert backend.get_containers.call_count == 1
+    worker.force_refresh()
+    worker.run_once()
+    assert backend.get_containers.call_count == 2
+    assert backend.get_images.call_count == 2
+
+
+def test_bulk_toggle_container_selection_visible_in_snapshot(clean_state):
+    sm = clean_state
     sm.update_containers(
         [
             ContainerInfo(
@@ -62,17 +82,13 @@ def test_bulk_toggle_container_selection_visible_in_snapshot():
 
 
 def test_textual_compose_menu_uses_remove_and_pause_labels():
-    app = TockerTextualApp()
-    options_map = {
-        "compose": [("Up", "U"), ("Down", "D"), ("Remove", "r"), ("Pause", "P")]
-    }
-    assert options_map["compose"][2] == ("Remove", "r")
-    assert options_map["compose"][3] == ("Pause", "P")
+    options = textual_app._MENU_OPTIONS["compose"]
+    assert ("Remove", "r") in options
+    assert ("Pause", "P") in options
 
 
 def test_textual_space_binding_for_selection():
-    app = TockerTextualApp()
-    keys = [binding.key for binding in app.BINDINGS]
+    keys = [binding.key for binding in TockerTextualApp.BINDINGS]
     assert "space" in keys
 
 
@@ -87,3 +103,231 @@ def test_non_filter_mode_allows_action_bindings():
     app = TockerTextualApp()
     app.is_filtering = False
     assert app.check_action("tab_images", ()) is True
+
+
+def test_container_row_keeps_fixed_column_layout():
+    from tockerdui.textual_app import _ROW_FIELDS, _layout_for_tab
+
+    fields = _ROW_FIELDS["containers"](
+        ContainerInfo(
+            id="c1",
+            short_id="c1",
+            name="web",
+            status="running",
+            image="nginx:latest",
+            project="shop",
+            cpu_percent="1.5%",
+            ram_usage="20.0MB",
+        )
+    )
+    row = _layout_for_tab("containers", 80) % fields
+    expected = (
+        "shop         web                  running    1.5%    20.0MB     nginx:latest"
+    )
+    assert row == expected
+    assert _layout_for_tab("containers", 80) % (*fields[:5], "x" * 40) == (
+        row[:-12] + "x" * 28
+    )
+    assert _layout_for_tab("containers", 110) % (*fields[:5], "x" * 40) == (
+        row[:-12] + "x" * 40
+    )
+
+
+def _wait_for(predicate, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def _log_backend(script, linger=0):
+    """Backend whose log stream is a Python child running *script*.
+
+    The stream is handed over once the child has flushed its output, so the
+    worker sees it as one burst like a real `docker logs --tail`; the child
+    then stays alive for *linger* seconds.
+    """
+    backend = MagicMock()
+    backend.processes = []
+    code = (
+        f"import sys, time\n{script}\n"
+        "sys.stdout.flush()\n"
+        "print('ready', file=sys.stderr, flush=True)\n"
+        f"time.sleep({linger})\n"
+    )
+
+    def spawn(cid, tail):
+        process = subprocess.Popen(
+            [sys.executable, "-c", code],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        process.stderr.readline()
+        process.stderr.close()
+        backend.processes.append(process)
+        return process
+
+    backend.get_log_stream_process.side_effect = spawn
+    return backend
+
+
+def test_log_tail_worker_streams_into_ring_buffer():
+    backend = _log_backend("print('one'); print('two'); print('three')")
+    worker = LogTailWorker(backend, max_lines=2)
+    worker.follow("c1")
+    worker.start()
+    try:
+        assert _wait_for(lambda: worker.snapshot()[1] == ["two", "three"])
+    finally:
+        worker.stop()
+        worker.join(timeout=2.0)
+    backend.get_log_stream_process.assert_called_with("c1", tail=100)
+
+
+def test_log_tail_worker_reads_whole_burst_from_live_stream():
+    backend = _log_backend(
+        "print('\\n'.join(f'line {i}' for i in range(100)))", linger=30
+    )
+    worker = LogTailWorker(backend)
+    worker.follow("c1")
+    worker.start()
+    try:
+        expected = [f"line {i}" for i in range(100)]
+        assert _wait_for(lambda: worker.snapshot()[1] == expected)
+    finally:
+        worker.stop()
+    # stop() itself ends the follower; it must not rely on the thread exiting.
+    assert backend.processes[0].wait(timeout=2.0) is not None
+    worker.join(timeout=2.0)
+
+
+def test_log_tail_worker_falls_back_to_sdk_logs():
+    backend = MagicMock()
+    backend.get_log_stream_process.side_effect = FileNotFoundError("docker")
+    backend.get_logs.return_value = ["from sdk"]
+    worker = LogTailWorker(backend)
+    worker.follow("c1")
+    worker.start()
+    try:
+        assert _wait_for(lambda: worker.snapshot()[1] == ["from sdk"])
+        worker.follow(None)
+        assert _wait_for(lambda: worker.snapshot()[1] == [])
+    finally:
+        worker.stop()
+        worker.join(timeout=2.0)
+
+
+def test_log_tail_worker_keeps_polling_sdk_logs_without_cli():
+    backend = MagicMock()
+    backend.get_log_stream_process.side_effect = FileNotFoundError("docker")
+    backend.get_logs.side_effect = lambda cid, tail: [
+        f"poll {backend.get_logs.call_count}"
+    ]
+    worker = LogTailWorker(backend)
+    worker.follow("c1")
+    worker.start()
+    try:
+        assert _wait_for(lambda: backend.get_logs.call_count > 1)
+        assert _wait_for(lambda: worker.snapshot()[1] != ["poll 1"])
+    finally:
+        worker.stop()
+        worker.join(timeout=2.0)
+
+
+def test_selection_snapshot_tracks_selection_version():
+    app = TockerTextualApp()
+    app._render = MagicMock()
+    app.containers = [
+        ContainerInfo("c1", "c1", "a", "running", "nginx"),
+        ContainerInfo("c2", "c2", "b", "running", "nginx"),
+    ]
+    app.action_toggle_bulk()
+
+    app.action_toggle_select()
+    first = app._selection_snapshot()
+    assert first == frozenset({"c1"})
+    assert app._selection_snapshot() is first
+
+    app.selected_index = 1
+    app.action_toggle_select()
+    assert app._selection_snapshot() == frozenset({"c1", "c2"})
+
+    app.action_select_none()
+    assert app._selection_snapshot() == frozenset()
+
+    app.action_select_all()
+    assert app._selection_snapshot() == frozenset({"c1", "c2"})
+
+
+def test_cpu_sort_puts_containers_without_stats_last():
+    app = TockerTextualApp()
+    app.sort_mode = "cpu"
+    app.containers = [
+        ContainerInfo("a", "a", "a", "exited", "img", cpu_percent="--"),
+        ContainerInfo("b", "b", "b", "running", "img", cpu_percent="2.0%"),
+        ContainerInfo("c", "c", "c", "running", "img", cpu_percent="10.5%"),
+    ]
+    assert [c.id for c in app._get_tab_items("containers")] == ["c", "b", "a"]
+
+
+def test_filter_uses_per_tab_fields():
+    app = TockerTextualApp()
+    app.containers = [
+        ContainerInfo("a", "a", "web", "running", "nginx:latest"),
+        ContainerInfo("b", "b", "db", "running", "postgres:16"),
+    ]
+    app.images = [
+        ImageInfo("i1", "sha256:aaa", ["nginx:latest"], 10.0, "2024"),
+        ImageInfo("i2", "sha256:bbb", ["redis:7"], 10.0, "2024"),
+    ]
+    app.filter_text = "NGINX"
+    assert [c.id for c in app._get_tab_items("containers")] == ["a"]
+    assert [i.id for i in app._get_tab_items("images")] == ["i1"]
+    assert app._get_tab_items("stats") == []
+
+
+def test_tab_items_rebuilt_only_when_view_changes():
+    app = TockerTextualApp()
+    app.containers = [ContainerInfo("a", "a", "web", "running", "nginx")]
+    first = app._get_tab_items()
+    assert app._get_tab_items() is first
+
+    app.containers = app.containers + [ContainerInfo("b", "b", "db", "running", "pg")]
+    app._data_version += 1
+    assert [c.id for c in app._get_tab_items()] == ["b", "a"]
+
+
+def test_refresh_all_bumps_data_version_only_on_change():
+    app = TockerTextualApp()
+    names = ["web"]
+    stats = {"cpu": "1.0%"}
+    app.backend = MagicMock(
+        **{
+            "get_containers.side_effect": lambda: [
+                ContainerInfo(name, name, name, "running", "nginx") for name in names
+            ],
+            "get_self_usage.return_value": "10MB",
+            "get_container_stats.side_effect": lambda cid: (stats["cpu"], "5MB"),
+            "get_images.return_value": [],
+            "get_volumes.return_value": [],
+            "get_networks.return_value": [],
+            "get_composes.return_value": [],
+        }
+    )
+
+    def refresh():
+        asyncio.run(app._refresh_all(force=True))
+        return app._data_version
+
+    version = refresh()
+    assert refresh() == version  # Identical data
+
+    stats["cpu"] = "2.0%"
+    assert refresh() > version  # Stats changed
+    version = app._data_version
+
+    names.append("db")
+    assert refresh() > version  # Container list changed
@@ -1,52 +1,75 @@
+from dataclasses import dataclass, field
+from typing import ClassVar
+
 import pytest
-from tockerdui.state import StateManager
-from unittest.mock import MagicMock
 
+@dataclass(frozen=True, slots=True)
 class MockContainer:
-    def __init__(self, id, name):
-        self.id = id
-        self.short_id = id[:12] if len(id) > 12 else id
-        self.name = name
-        self.status = "running"
-        self.image = "nginx:latest"
-        self.project = ""
-        self.cpu_percent = 0
-        self.ram_usage = "0MB"
+    id: str
+    name: str
+    short_id: str = field(init=False)
+    status: ClassVar[str] = "running"
+    image: ClassVar[str] = "nginx:latest"
+    project: ClassVar[str] = ""
+    cpu_percent: ClassVar[int] = 0
+    ram_usage: ClassVar[str] = "0MB"
+
+    def __post_init__(self):
+        object.__setattr__(self, "short_id", self.id[:12])
+
     def __lt__(self, other):
         return self.name < other.name
 
-def test_state_selection():
-    sm = StateManager()
-    
-    # Simulate data
-    c_list = []
-    for i in [1, 2, 3, 4, 5]:
-        m = MockContainer(id=str(i), name=f"c{i}")
-        c_list.append(m)
-    sm.update_containers(c_list)
-    
-    # Default index 0
-    assert sm.get_snapshot().selected_index == 0
-    
-    # Move down
-    sm.move_selection(1)
-    assert sm.get_snapshot().selected_index == 1
-    
-    # Move past end (clamping)
-    sm.move_selection(100)
-    assert sm.get_snapshot().selected_index == 4 # index 4 is last element (len 5)
-    
-    # Move up past 0 (clamping)
-    sm.move_selection(-100)
-    assert sm.get_snapshot().selected_index == 0
+@pytest.fixture(scope="module")
+def containers5():
+    """Five mock containers, built once and shared by the tests in this module."""
+    return tuple(MockContainer(id=str(i), name=f"c{i}") for i in range(1, 6))
+
+@pytest.mark.parametrize(
+    "deltas,expected",
+    [
+        ([], 0),  # Default index 0
+        ([1], 1),  # Move down
+        ([1, 100], 4),  # Move past end (clamping): index 4 is last element (len 5)
+        ([1, 100, -100], 0),  # Move up past 0 (clamping)
+    ],
+)
+def test_state_selection(clean_state, containers5, deltas, expected):
+    sm = clean_state
+    sm.update_containers(list(containers5))
+    for delta in deltas:
+        sm.move_selection(delta)
+    assert sm.get_selected_index() == expected
 
-def test_tab_switch_resets_index():
-    sm = StateManager()
-    sm.update_containers([MockContainer(id=str(i), name=f"c{i}") for i in [1, 2, 3]])
+def test_tab_switch_resets_index(clean_state):
+    sm = clean_state
+    sm.update_containers([MockContainer(id=str(i), name=f"c{i}") for i in range(1, 4)])
     sm.move_selection(2)
-    assert sm.get_snapshot().selected_index == 2
+    assert sm.get_selected_index() == 2
     
     sm.set_tab("images")
     snap = sm.get_snapshot()
     assert snap.selected_tab == "images"
     assert snap.selected_index == 0
+
+def test_reset_discards_state(clean_state):
+    sm = clean_state
+    sm.update_containers([MockContainer(id="1", name="c1")])
+    sm.set_filter_text("c")
+    version = sm.get_version()
+
+    sm.reset()
+    snap = sm.get_snapshot()
+    assert snap.containers == []
+    assert snap.filter_text == ""
+    assert sm.get_version() > version
+
+def test_snapshot_reused_until_state_changes(clean_state):
+    sm = clean_state
+    first = sm.get_snapshot()
+    assert sm.get_snapshot() is first
+
+    sm.set_filter_text("web")
+    second = sm.get_snapshot()
+    assert second is not first
+    assert second.filter_text == "web"
@@ -0,0 +1,7 @@
+from tockerdui.stats import ChartRenderer
+
+
+def test_sparkline_scales_window_to_glyph_range():
+    assert ChartRenderer.sparkline([0.0, 3.5, 7.0, 99.0], width=3) == "▁▁▁"
+    assert ChartRenderer.sparkline([0.0, 3.5, 7.0], width=3) == "▁▄█"
+    assert ChartRenderer.sparkline([2.0, 2.0], width=5) == "▄▄"